@@ -0,0 +1,114 @@
+"""Application factory and ASGI entry point."""
+
+import logging
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+
+from src.api.routers.recipes import router as recipes_router
+from src.api.routers.search import router as search_router
+from src.api.routers.users import router as users_router
+from src.core.config import get_settings
+from src.core.errors import AppError, error_response
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - not available on all platforms
+    uvloop = None
+else:
+    # C-implemented event loop; 15-50% faster on I/O-bound handling with
+    # no handler changes required.
+    uvloop.install()
+
+logger = logging.getLogger("recipe_explorer")
+
+
+class RequestLogMiddleware:
+    """Pure ASGI request logging.
+
+    Avoids Starlette's BaseHTTPMiddleware, which spawns an extra anyio task
+    and wraps Request/Response objects on every request.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        state = scope.setdefault("state", {})
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Health checks go to DEBUG; everything else only pays for
+            # formatting when INFO is actually enabled.
+            level = logging.DEBUG if scope["path"] == "/" else logging.INFO
+            if logger.isEnabledFor(level):
+                duration_ms = (time.perf_counter() - start) * 1000
+                logger.log(
+                    level,
+                    "request_log method=%s path=%s status=%s duration_ms=%.2f user_id=%s",
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    duration_ms,
+                    state.get("user_id"),
+                )
+
+
+def create_app() -> FastAPI:
+    settings = get_settings()
+    app = FastAPI(
+        title=settings.app_name,
+        version="0.1.0",
+        default_response_class=ORJSONResponse,
+    )
+
+    # Added first so it sits innermost and compresses the final body;
+    # list/search pages of JSON compress 5-10x at negligible CPU cost.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
+    # A wildcard origin combined with credentials is invalid per the CORS
+    # spec and forces CORSMiddleware to echo the Origin header on every
+    # request; only enable credentials for an explicit allowlist.
+    cors_origins = settings.cors_allow_origins
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cors_origins,
+        allow_credentials=cors_origins != ["*"],
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.add_middleware(RequestLogMiddleware)
+
+    @app.exception_handler(AppError)
+    async def app_error_handler(request: Request, exc: AppError):
+        return error_response(exc)
+
+    app.include_router(users_router)
+    app.include_router(recipes_router)
+    app.include_router(search_router)
+
+    @app.get("/")
+    def health():
+        return {"status": "ok", "service": settings.app_name}
+
+    return app
+
+
+app = create_app()
@@ -0,0 +1,83 @@
+"""Recipe CRUD and rating endpoints."""
+
+from typing import Annotated, List, Optional
+
+from fastapi import APIRouter, Depends, Path, Query, Response
+from fastapi.responses import ORJSONResponse
+
+from src.core.security import CurrentUser
+from src.models.schemas import (
+    RatingCreate,
+    RecipeCreate,
+    RecipePage,
+    RecipePublic,
+    RecipeUpdate,
+)
+from src.services.recipes import RecipeService, recipe_service
+
+RecipeSvc = Annotated[RecipeService, Depends(recipe_service, use_cache=True)]
+
+router = APIRouter(
+    prefix="/recipes", tags=["recipes"], default_response_class=ORJSONResponse
+)
+
+
+@router.get("", response_model=RecipePage)
+def list_recipes(
+    service: RecipeSvc,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    tags: Optional[List[str]] = Query(None),
+    cuisine: Optional[str] = None,
+    time_max: Optional[int] = Query(None, ge=0),
+) -> RecipePage:
+    return service.list_recipes(
+        page=page, page_size=page_size, tags=tags, cuisine=cuisine, time_max=time_max
+    )
+
+
+@router.post("", response_model=RecipePublic, status_code=201)
+def create_recipe(
+    payload: RecipeCreate,
+    service: RecipeSvc,
+    current_user: CurrentUser,
+) -> RecipePublic:
+    return service.create_recipe(payload)
+
+
+@router.get("/{recipe_id}", response_model=RecipePublic)
+def get_recipe(
+    service: RecipeSvc,
+    recipe_id: str = Path(...),
+) -> RecipePublic:
+    return service.get_recipe(recipe_id)
+
+
+@router.put("/{recipe_id}", response_model=RecipePublic)
+def update_recipe(
+    payload: RecipeUpdate,
+    service: RecipeSvc,
+    current_user: CurrentUser,
+    recipe_id: str = Path(...),
+) -> RecipePublic:
+    return service.update_recipe(recipe_id, payload)
+
+
+@router.delete("/{recipe_id}", status_code=204)
+def delete_recipe(
+    service: RecipeSvc,
+    current_user: CurrentUser,
+    recipe_id: str = Path(...),
+) -> Response:
+    service.delete_recipe(recipe_id)
+    return Response(status_code=204)
+
+
+@router.post("/{recipe_id}/ratings", response_model=RecipePublic)
+def rate_recipe(
+    payload: RatingCreate,
+    service: RecipeSvc,
+    current_user: CurrentUser,
+    recipe_id: str = Path(...),
+) -> RecipePublic:
+    return service.rate_recipe(recipe_id, current_user.id, payload.rating)
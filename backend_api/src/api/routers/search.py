@@ -0,0 +1,32 @@
+"""Full-text recipe search endpoint."""
+
+from typing import Annotated, List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
+
+from src.core.security import CurrentUser
+from src.models.schemas import RecipePage, RecipePublic
+from src.services.search_service import SearchService, search_service
+
+SearchSvc = Annotated[SearchService, Depends(search_service, use_cache=True)]
+
+router = APIRouter(
+    prefix="/search", tags=["search"], default_response_class=ORJSONResponse
+)
+
+
+@router.get("", response_model=RecipePage)
+def search(
+    service: SearchSvc,
+    current_user: CurrentUser,
+    q: str = Query(min_length=1),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    tags: Optional[List[str]] = Query(None),
+    cuisine: Optional[str] = None,
+    time_max: Optional[int] = Query(None, ge=0),
+) -> RecipePage:
+    return service.search(
+        q, page=page, page_size=page_size, tags=tags, cuisine=cuisine, time_max=time_max
+    )
@@ -0,0 +1,56 @@
+"""User registration, login and session endpoints."""
+
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
+
+from src.core.errors import unauthorized
+from src.core.security import CurrentUser, oauth2_scheme, token_service
+from src.models.schemas import LoginRequest, TokenResponse, UserCreate, UserPublic
+from src.services.users import UserService, user_service
+
+UserSvc = Annotated[UserService, Depends(user_service, use_cache=True)]
+
+router = APIRouter(
+    prefix="/users", tags=["users"], default_response_class=ORJSONResponse
+)
+
+
+@router.post("/register", response_model=UserPublic, status_code=201)
+def register(
+    payload: UserCreate,
+    service: UserSvc,
+) -> UserPublic:
+    return service.register_user(payload)
+
+
+@router.post("/login", response_model=TokenResponse)
+def login(
+    payload: LoginRequest,
+    service: UserSvc,
+) -> TokenResponse:
+    user = service.authenticate(payload.identity, payload.password)
+    if user is None:
+        raise unauthorized("Invalid credentials")
+    token, data = token_service().create_token(user.id)
+    return TokenResponse(
+        access_token=token, expires_at=datetime.utcfromtimestamp(data.exp)
+    )
+
+
+@router.get("/me", response_model=UserPublic)
+def me(current_user: CurrentUser) -> UserPublic:
+    return current_user
+
+
+@router.post("/logout", status_code=204)
+async def logout(
+    request: Request,
+    current_user: CurrentUser,
+) -> Response:
+    token = await oauth2_scheme(request)
+    if token:
+        token_service().revoke_token(token)
+    return Response(status_code=204)
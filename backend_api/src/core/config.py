@@ -0,0 +1,32 @@
+"""Application configuration loaded from environment variables."""
+
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Process-wide settings. Frozen so it can be shared freely."""
+
+    app_name: str = "Recipe Explorer API"
+    secret_key: str = field(
+        default_factory=lambda: os.getenv("SECRET_KEY", "dev-secret-key-change-me")
+    )
+    token_ttl_seconds: int = field(
+        default_factory=lambda: int(os.getenv("TOKEN_TTL_SECONDS", "3600"))
+    )
+    cors_allow_origins: List[str] = field(
+        default_factory=lambda: [
+            o.strip().lower()
+            for o in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",")
+            if o.strip()
+        ]
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the memoized Settings instance."""
+    return Settings()
@@ -0,0 +1,71 @@
+"""Application error type and helpers for consistent error responses."""
+
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+from fastapi.responses import ORJSONResponse, Response
+
+
+class AppError(Exception):
+    """Base error carrying an HTTP status code and a stable error code."""
+
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        status_code: int = 400,
+        details: Optional[Any] = None,
+    ) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+        self.details = details
+
+
+def bad_request(message: str, details: Optional[Any] = None) -> AppError:
+    return AppError("bad_request", message, 400, details)
+
+
+def unauthorized(message: str = "Not authenticated", details: Optional[Any] = None) -> AppError:
+    return AppError("unauthorized", message, 401, details)
+
+
+def not_found(message: str, details: Optional[Any] = None) -> AppError:
+    return AppError("not_found", message, 404, details)
+
+
+def conflict(message: str, details: Optional[Any] = None) -> AppError:
+    return AppError("conflict", message, 409, details)
+
+
+# Encoded envelopes for detail-less errors. The app raises a small fixed
+# set of (code, message) pairs (bad tokens, missing recipes, duplicate
+# registrations), and these are the most frequent responses after 200s,
+# so their bytes are built once and reused.
+_frozen: Dict[Tuple[int, str, str], bytes] = {}
+
+
+def error_response(exc: AppError) -> Response:
+    """Build the JSON error envelope for an AppError."""
+    if exc.details is None:
+        key = (exc.status_code, exc.code, exc.message)
+        body = _frozen.get(key)
+        if body is None:
+            body = orjson.dumps(
+                {"error": {"code": exc.code, "message": exc.message, "details": None}}
+            )
+            _frozen[key] = body
+        return Response(
+            content=body,
+            status_code=exc.status_code,
+            media_type="application/json",
+        )
+    payload = {
+        "error": {
+            "code": exc.code,
+            "message": exc.message,
+            "details": exc.details,
+        }
+    }
+    return ORJSONResponse(status_code=exc.status_code, content=payload)
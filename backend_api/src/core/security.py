@@ -0,0 +1,167 @@
+"""Password hashing, opaque bearer tokens and auth dependencies."""
+
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated, Dict, Optional, Tuple
+
+from fastapi import Depends, Request
+from fastapi.security import OAuth2PasswordBearer
+
+from src.core.config import get_settings
+from src.core.errors import unauthorized
+from src.models.schemas import UserPublic
+from src.storage.memory_repo import memory_user_repo
+
+# Kept for the OpenAPI security declaration; request-path extraction
+# uses _extract_bearer below.
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/users/login", auto_error=False)
+
+
+def _extract_bearer(request: Request) -> Optional[str]:
+    """Pull the bearer token from the Authorization header.
+
+    One header lookup and a slice, versus a full OAuth2PasswordBearer
+    call frame per request.
+    """
+    auth = request.headers.get("authorization")
+    if auth is None or auth[:7].lower() != "bearer ":
+        return None
+    return auth[7:]
+
+
+def hash_password(password: str, salt: Optional[str] = None) -> Tuple[str, str]:
+    """Hash a password with a random (or supplied) salt; returns (salt, hash).
+
+    The salt and password are fed to the digest separately; building the
+    concatenated string first just allocated an extra throwaway string
+    per call.
+    """
+    if salt is None:
+        salt = os.urandom(16).hex()
+    h = hashlib.sha256()
+    h.update(salt.encode("utf-8"))
+    h.update(password.encode("utf-8"))
+    return salt, h.hexdigest()
+
+
+def verify_password(password: str, salt: str, pwd_hash: str) -> bool:
+    h = hashlib.sha256()
+    h.update(salt.encode("utf-8"))
+    h.update(password.encode("utf-8"))
+    # Constant-time C-level compare: str == short-circuits on the first
+    # differing byte, which leaks hash-prefix timing.
+    return hmac.compare_digest(h.hexdigest(), pwd_hash)
+
+
+@dataclass
+class TokenData:
+    sub: str
+    exp: float
+
+
+class TokenStore:
+    """In-memory store of issued tokens; the source of truth for revocation.
+
+    Reads are lock-free: a single dict.get is atomic under CPython's
+    GIL, and the auth hot path performs one per request. Only writers
+    (issue/revoke) take the lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, TokenData] = {}
+
+    def put(self, token: str, data: TokenData) -> None:
+        with self._lock:
+            self._tokens[token] = data
+
+    def get(self, token: str) -> Optional[TokenData]:
+        return self._tokens.get(token)
+
+    def revoke(self, token: str) -> None:
+        with self._lock:
+            self._tokens.pop(token, None)
+
+
+_token_store = TokenStore()
+
+
+class TokenService:
+    """Issues and verifies HMAC-signed opaque tokens backed by TokenStore."""
+
+    def __init__(self) -> None:
+        settings = get_settings()
+        self._key = settings.secret_key.encode("utf-8")
+        self._ttl = settings.token_ttl_seconds
+        self.store = _token_store
+
+    def create_token(self, user_id: str) -> Tuple[str, TokenData]:
+        exp = time.time() + self._ttl
+        payload = f"{user_id}:{exp}:{os.urandom(8).hex()}".encode("utf-8")
+        sig = hmac.new(self._key, payload, hashlib.sha256).digest()
+        token = base64.urlsafe_b64encode(payload + b"." + sig).decode("ascii").rstrip("=")
+        data = TokenData(sub=user_id, exp=exp)
+        self.store.put(token, data)
+        return token, data
+
+    def verify_token(self, token: str) -> Optional[TokenData]:
+        # The store is authoritative: it only contains tokens issued by
+        # this process and enforces revocation, so a forged token simply
+        # misses the dict. Re-verifying the HMAC signature on every
+        # request added a base64 decode plus a SHA-256 round for no
+        # additional guarantee. Tokens stay signed (create_token) so a
+        # stateless verification path remains possible later.
+        data = self.store.get(token)
+        if data is None or data.exp < time.time():
+            return None
+        return data
+
+    def revoke_token(self, token: str) -> None:
+        self.store.revoke(token)
+
+
+@lru_cache(maxsize=1)
+def token_service() -> TokenService:
+    # Settings are frozen, so one instance can serve the whole process;
+    # this avoids rebuilding the service (and re-reading settings) on
+    # every auth check.
+    return TokenService()
+
+
+async def get_current_user(request: Request) -> UserPublic:
+    token = _extract_bearer(request)
+    if not token:
+        raise unauthorized()
+    data = token_service().verify_token(token)
+    if data is None:
+        raise unauthorized("Invalid or expired token")
+    user = memory_user_repo.get_by_id(data.sub)
+    if user is None:
+        raise unauthorized("Invalid or expired token")
+    request.state.user_id = user.id
+    return UserPublic.model_validate(user)
+
+
+async def get_current_user_optional(request: Request) -> Optional[UserPublic]:
+    token = _extract_bearer(request)
+    if not token:
+        return None
+    data = token_service().verify_token(token)
+    if data is None:
+        return None
+    user = memory_user_repo.get_by_id(data.sub)
+    if user is None:
+        return None
+    request.state.user_id = user.id
+    return UserPublic.model_validate(user)
+
+
+# Shared dependency alias so every route resolves the user through the
+# same (per-request cached) dependant.
+CurrentUser = Annotated[UserPublic, Depends(get_current_user, use_cache=True)]
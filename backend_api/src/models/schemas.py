@@ -0,0 +1,113 @@
+"""Pydantic schemas for the public API surface."""
+
+from datetime import datetime
+from functools import cached_property
+from typing import Generic, List, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+
+T = TypeVar("T")
+
+
+def _ns_to_datetime(value: object) -> object:
+    """Convert repo timestamps (integer nanoseconds) to datetime.
+
+    The stores keep timestamps as time.time_ns() ints so hot write paths
+    skip datetime construction; the conversion happens once here at the
+    serialization boundary.
+    """
+    if isinstance(value, int):
+        return datetime.utcfromtimestamp(value / 1_000_000_000)
+    return value
+
+
+class UserCreate(BaseModel):
+    email: EmailStr
+    username: str = Field(min_length=3, max_length=64)
+    password: str = Field(min_length=8, max_length=128)
+
+    @cached_property
+    def email_str(self) -> str:
+        """Lowercased plain-str email, coerced once per model instance."""
+        return str(self.email).lower()
+
+
+class UserPublic(BaseModel):
+    # Validated straight off the repo's slotted row structs.
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    email: EmailStr
+    username: str
+    created_at: datetime
+
+    _created_from_ns = field_validator("created_at", mode="before")(_ns_to_datetime)
+
+
+class LoginRequest(BaseModel):
+    identity: str = Field(description="Username or email")
+    password: str
+
+
+class TokenResponse(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+    expires_at: datetime
+
+
+class RecipeCreate(BaseModel):
+    title: str = Field(min_length=1, max_length=200)
+    description: str = ""
+    ingredients: List[str] = Field(default_factory=list)
+    steps: List[str] = Field(default_factory=list)
+    tags: List[str] = Field(default_factory=list)
+    cuisine: Optional[str] = None
+    time_minutes: int = Field(default=0, ge=0)
+
+
+class RecipeUpdate(BaseModel):
+    title: Optional[str] = Field(default=None, min_length=1, max_length=200)
+    description: Optional[str] = None
+    ingredients: Optional[List[str]] = None
+    steps: Optional[List[str]] = None
+    tags: Optional[List[str]] = None
+    cuisine: Optional[str] = None
+    time_minutes: Optional[int] = Field(default=None, ge=0)
+
+
+class RecipePublic(BaseModel):
+    # Validated straight off the repo's slotted row structs.
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    title: str
+    description: str
+    ingredients: List[str]
+    steps: List[str]
+    tags: List[str]
+    cuisine: Optional[str]
+    time_minutes: int
+    rating_avg: float
+    rating_count: int
+    created_at: datetime
+    updated_at: datetime
+
+    _timestamps_from_ns = field_validator("created_at", "updated_at", mode="before")(
+        _ns_to_datetime
+    )
+
+
+class RatingCreate(BaseModel):
+    rating: int = Field(ge=1, le=5)
+
+
+class Page(BaseModel, Generic[T]):
+    items: Sequence[T]
+    total: int
+    page: int
+    page_size: int
+
+
+# Resolved once here; subscripting Page[RecipePublic] inline hits
+# Pydantic's generic cache on every use.
+RecipePage = Page[RecipePublic]
@@ -0,0 +1,73 @@
+"""Recipe CRUD, filtering and pagination."""
+
+from functools import lru_cache
+from typing import List, Optional
+
+from src.core.errors import not_found
+from src.models.schemas import RecipeCreate, RecipePage, RecipePublic, RecipeUpdate
+from src.storage.memory_repo import MemoryRecipeRepository, RecipeRow, memory_recipe_repo
+
+
+def to_public(rec: RecipeRow) -> RecipePublic:
+    """Validated view of a repo row, cached on the row until its next write."""
+    pub = rec._public
+    if pub is None:
+        pub = RecipePublic.model_validate(rec)
+        rec._public = pub
+    return pub
+
+
+class RecipeService:
+    def __init__(self) -> None:
+        self.repo: MemoryRecipeRepository = memory_recipe_repo
+
+    def create_recipe(self, data: RecipeCreate) -> RecipePublic:
+        rec = self.repo.create(data.model_dump())
+        return to_public(rec)
+
+    def get_recipe(self, recipe_id: str) -> RecipePublic:
+        rec = self.repo.get(recipe_id)
+        if rec is None:
+            raise not_found("Recipe not found")
+        return to_public(rec)
+
+    def update_recipe(self, recipe_id: str, data: RecipeUpdate) -> RecipePublic:
+        rec = self.repo.update(recipe_id, data.model_dump())
+        if rec is None:
+            raise not_found("Recipe not found")
+        return to_public(rec)
+
+    def delete_recipe(self, recipe_id: str) -> None:
+        if not self.repo.delete(recipe_id):
+            raise not_found("Recipe not found")
+
+    def rate_recipe(self, recipe_id: str, user_id: str, rating: int) -> RecipePublic:
+        rec = self.repo.upsert_rating(recipe_id, user_id, rating)
+        if rec is None:
+            raise not_found("Recipe not found")
+        return to_public(rec)
+
+    def list_recipes(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        tags: Optional[List[str]] = None,
+        cuisine: Optional[str] = None,
+        time_max: Optional[int] = None,
+    ) -> RecipePage:
+        candidate = self.repo.find_ids(tags=tags, cuisine=cuisine, time_max=time_max)
+        start = (page - 1) * page_size
+        rows, total = self.repo.page_rows(candidate, start, start + page_size)
+        page_items = [to_public(it) for it in rows]
+        # Contents are already validated models and trusted ints, so
+        # skip the Page validator chain.
+        return RecipePage.model_construct(
+            items=page_items, total=total, page=page, page_size=page_size
+        )
+
+
+@lru_cache(maxsize=1)
+def recipe_service() -> RecipeService:
+    # Stateless wrapper around the singleton repo; one instance
+    # serves the whole process.
+    return RecipeService()
@@ -0,0 +1,51 @@
+"""Full-text recipe search over titles, descriptions and ingredients."""
+
+from functools import lru_cache
+from typing import List, Optional
+
+from src.models.schemas import RecipePage, RecipePublic
+from src.services.recipes import to_public
+from src.storage.memory_repo import MemoryRecipeRepository, memory_recipe_repo
+
+
+class SearchService:
+    def __init__(self) -> None:
+        self.repo: MemoryRecipeRepository = memory_recipe_repo
+
+    def search(
+        self,
+        q: str,
+        page: int = 1,
+        page_size: int = 20,
+        tags: Optional[List[str]] = None,
+        cuisine: Optional[str] = None,
+        time_max: Optional[int] = None,
+    ) -> RecipePage:
+        ql = q.lower()
+        candidate = self.repo.find_ids(tags=tags, cuisine=cuisine, time_max=time_max)
+        text_ids = self.repo.ids_for_text(ql)
+        if text_ids is not None:
+            candidate = text_ids if candidate is None else candidate & text_ids
+        if candidate is None:
+            items = self.repo.list_all()
+        else:
+            items = self.repo.get_many(candidate)
+        # Trigram candidates can contain false positives; confirm with a
+        # substring test against the precomputed blob.
+        matched = [it for it in items if ql in it.search_blob_lower]
+        total = len(matched)
+        start = (page - 1) * page_size
+        end = start + page_size
+        page_items = [to_public(it) for it in matched[start:end]]
+        # Contents are already validated models and trusted ints, so
+        # skip the Page validator chain.
+        return RecipePage.model_construct(
+            items=page_items, total=total, page=page, page_size=page_size
+        )
+
+
+@lru_cache(maxsize=1)
+def search_service() -> SearchService:
+    # Stateless wrapper around the singleton repo; one instance
+    # serves the whole process.
+    return SearchService()
@@ -0,0 +1,86 @@
+"""User registration and authentication."""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+from src.core.errors import conflict
+from src.core.security import hash_password, verify_password
+from src.models.schemas import UserCreate, UserPublic
+from src.storage.memory_repo import MemoryUserRepository, memory_user_repo
+
+# Stand-in credentials hashed at import so authenticate() does the same
+# amount of work whether or not the identity exists.
+_DUMMY_SALT, _DUMMY_HASH = hash_password("x" * 32)
+
+
+@lru_cache(maxsize=8192)
+def _build_user_public(uid: str, email: str, username: str, created_at: int) -> UserPublic:
+    """Memoized public view of a user row.
+
+    User rows are immutable after creation, so a cached entry can never
+    go stale; the key is simply every field the view carries. Login
+    traffic concentrates on a small set of active users, so repeat
+    authentications skip model construction entirely.
+
+    model_construct is safe here because the fields come straight from
+    our own repo, which already validated them on the way in; it skips
+    validators, so the nanosecond timestamp is converted by hand.
+    """
+    return UserPublic.model_construct(
+        id=uid,
+        email=email,
+        username=username,
+        created_at=datetime.utcfromtimestamp(created_at / 1_000_000_000),
+    )
+
+
+class UserService:
+    def __init__(self) -> None:
+        self.repo: MemoryUserRepository = memory_user_repo
+
+    def register_user(self, data: UserCreate) -> UserPublic:
+        # Fail fast on obvious duplicates without touching the shard
+        # locks; create() re-checks under them, so a racing registration
+        # that slips past this probe is still rejected there.
+        if self.repo.fast_exists_email(data.email_str):
+            raise conflict("email already registered")
+        if self.repo.fast_exists_username(data.username):
+            raise conflict("username already taken")
+        salt, pwd_hash = hash_password(data.password)
+        try:
+            user = self.repo.create(data.email_str, data.username, salt, pwd_hash)
+        except ValueError as exc:
+            raise conflict(str(exc)) from exc
+        return _build_user_public(user.id, user.email, user.username, user.created_at)
+
+    def authenticate(self, identity: str, password: str) -> Optional[UserPublic]:
+        """Look up a user by username or email and verify the password.
+
+        Deliberately not short-circuited: an unknown identity still runs
+        the full hash against dummy credentials, so response time does
+        not leak which usernames exist and login latency stays flat.
+        The repo's identity index resolves either form in one probe.
+        """
+        user = self.repo.get_by_identity(identity)
+        if user is not None:
+            salt, pwd_hash = user.salt, user.pwd_hash
+        else:
+            salt, pwd_hash = _DUMMY_SALT, _DUMMY_HASH
+        ok = verify_password(password, salt, pwd_hash)
+        if ok & (user is not None):
+            return _build_user_public(user.id, user.email, user.username, user.created_at)
+        return None
+
+    def get_user(self, uid: str) -> Optional[UserPublic]:
+        user = self.repo.get_by_id(uid)
+        if user is None:
+            return None
+        return _build_user_public(user.id, user.email, user.username, user.created_at)
+
+
+@lru_cache(maxsize=1)
+def user_service() -> UserService:
+    # Stateless wrapper around the singleton repo; one instance
+    # serves the whole process.
+    return UserService()
@@ -0,0 +1,481 @@
+"""In-memory repositories backing the API.
+
+These are process-local stores intended for the container preview
+environment; they hold slotted row structs guarded by locks.
+"""
+
+import bisect
+import itertools
+import os
+import sys
+import threading
+import time
+import types
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+_EMPTY: frozenset = frozenset()
+
+
+@dataclass(slots=True)
+class UserRow:
+    """Stored user record.
+
+    A slotted struct instead of a dict: field access is a C-level slot
+    read and the per-row footprint is a fraction of a dict's.
+    """
+
+    id: str
+    email: str
+    username: str
+    salt: str
+    pwd_hash: str
+    created_at: int
+
+
+@dataclass(slots=True)
+class RecipeRow:
+    """Stored recipe record, including derived search fields."""
+
+    id: str
+    title: str
+    description: str
+    ingredients: List[str]
+    steps: List[str]
+    tags: List[str]
+    cuisine: Optional[str]
+    time_minutes: int
+    rating_avg: float
+    rating_count: int
+    created_at: int
+    updated_at: int
+    # Derived by _derive_search_fields on every write.
+    tags_lower: frozenset = _EMPTY
+    cuisine_lower: str = ""
+    search_blob_lower: str = ""
+    # Lazily-built RecipePublic cache; cleared on every write.
+    _public: Optional[object] = None
+
+
+class _UserShard:
+    """Write lock plus an immutable snapshot of this shard's indexes."""
+
+    __slots__ = ("lock", "state")
+
+    # Positions in the state tuple. by_identity maps both the email and
+    # the username to the uid so login resolves in one probe.
+    BY_ID, BY_EMAIL, BY_USERNAME, BY_IDENTITY = range(4)
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # Copy-on-write snapshot of this shard's indexes. Readers
+        # dereference it once (an atomic attribute read under the GIL)
+        # and never lock; writers copy the affected dicts under `lock`
+        # and rebind the whole tuple.
+        self.state: Tuple[
+            Dict[str, UserRow], Dict[str, str], Dict[str, str], Dict[str, str]
+        ] = ({}, {}, {}, {})
+
+
+_USER_SHARDS = 16  # power of two so the shard pick is a mask
+
+
+class MemoryUserRepository:
+    """In-memory user store sharded by key hash.
+
+    Reads are lock-free: each shard publishes its indexes as an
+    immutable snapshot tuple that writers replace wholesale, so lookups
+    never contend. Writers (registration only) take the affected shard
+    locks and pay the copy cost, which is the right trade for this
+    read-dominated workload.
+    """
+
+    def __init__(self) -> None:
+        self._shards = [_UserShard() for _ in range(_USER_SHARDS)]
+        self._mask = _USER_SHARDS - 1
+        # Specialize the shard dispatch for this instance: the shard
+        # count is fixed at construction, so the mask is baked into the
+        # generated bytecode as a constant and each call skips the
+        # self._mask attribute load. The plain methods below remain as
+        # the readable reference implementation.
+        ns: Dict[str, object] = {}
+        exec(
+            f"def _shard_index(self, key):\n"
+            f"    return hash(key) & {self._mask}\n"
+            f"def _shard_for(self, key):\n"
+            f"    return self._shards[hash(key) & {self._mask}]\n",
+            ns,
+        )
+        self._shard_index = types.MethodType(ns["_shard_index"], self)
+        self._shard_for = types.MethodType(ns["_shard_for"], self)
+
+    def _shard_index(self, key: str) -> int:
+        return hash(key) & self._mask
+
+    def _shard_for(self, key: str) -> _UserShard:
+        return self._shards[hash(key) & self._mask]
+
+    def create(self, email: str, username: str, salt: str, pwd_hash: str) -> UserRow:
+        # Canonical, interned keys: emails match case-insensitively, and
+        # interning means the row and all three indexes share one string
+        # object, so dict probes short-circuit on identity.
+        email = sys.intern(email.lower())
+        username = sys.intern(username)
+        # Same 128 bits of entropy as uuid4 without building and
+        # formatting a UUID object per insert.
+        uid = os.urandom(16).hex()
+        # The duplicate check and the three index inserts must be one
+        # atomic step, so take every involved shard lock, in ascending
+        # index order to rule out deadlock with concurrent creates.
+        indexes = sorted(
+            {self._shard_index(email), self._shard_index(username), self._shard_index(uid)}
+        )
+        for i in indexes:
+            self._shards[i].lock.acquire()
+        try:
+            email_shard = self._shard_for(email)
+            username_shard = self._shard_for(username)
+            if email in email_shard.state[_UserShard.BY_EMAIL]:
+                raise ValueError("email already registered")
+            if username in username_shard.state[_UserShard.BY_USERNAME]:
+                raise ValueError("username already taken")
+            user = UserRow(
+                id=uid,
+                email=email,
+                username=username,
+                salt=salt,
+                pwd_hash=pwd_hash,
+                # Integer nanoseconds; schemas convert to datetime at the
+                # serialization boundary.
+                created_at=time.time_ns(),
+            )
+            # Group writes per shard so each snapshot is rebound once.
+            # Usernames win identity collisions, mirroring the old
+            # get_by_username-then-get_by_email precedence.
+            pending: Dict[int, List[Tuple[int, str, object, bool]]] = {}
+            pending.setdefault(self._shard_index(uid), []).append(
+                (_UserShard.BY_ID, uid, user, True)
+            )
+            pending.setdefault(self._shard_index(email), []).extend(
+                [
+                    (_UserShard.BY_EMAIL, email, uid, True),
+                    (_UserShard.BY_IDENTITY, email, uid, False),
+                ]
+            )
+            pending.setdefault(self._shard_index(username), []).extend(
+                [
+                    (_UserShard.BY_USERNAME, username, uid, True),
+                    (_UserShard.BY_IDENTITY, username, uid, True),
+                ]
+            )
+            for shard_index, entries in pending.items():
+                shard = self._shards[shard_index]
+                state = list(shard.state)
+                for slot, key, value, overwrite in entries:
+                    if overwrite or key not in state[slot]:
+                        state[slot] = {**state[slot], key: value}
+                shard.state = tuple(state)
+            return user
+        finally:
+            for i in reversed(indexes):
+                self._shards[i].lock.release()
+
+    def get_by_id(self, uid: str) -> Optional[UserRow]:
+        return self._shard_for(uid).state[_UserShard.BY_ID].get(uid)
+
+    def fast_exists_email(self, email: str) -> bool:
+        """Lock-free duplicate probe against the current shard snapshot.
+
+        A hit is definitive; a miss is only probably-free, so create()
+        still re-checks under the shard locks (double-checked locking).
+        """
+        email = email.lower()
+        return email in self._shard_for(email).state[_UserShard.BY_EMAIL]
+
+    def fast_exists_username(self, username: str) -> bool:
+        """Lock-free duplicate probe; see fast_exists_email."""
+        return username in self._shard_for(username).state[_UserShard.BY_USERNAME]
+
+    def get_by_email(self, email: str) -> Optional[UserRow]:
+        email = sys.intern(email.lower())
+        uid = self._shard_for(email).state[_UserShard.BY_EMAIL].get(email)
+        return self.get_by_id(uid) if uid else None
+
+    def get_by_username(self, username: str) -> Optional[UserRow]:
+        username = sys.intern(username)
+        uid = self._shard_for(username).state[_UserShard.BY_USERNAME].get(username)
+        return self.get_by_id(uid) if uid else None
+
+    def get_by_identity(self, identity: str) -> Optional[UserRow]:
+        """Resolve a username-or-email string with an index probe.
+
+        Usernames match as given; a miss retries with the lowercased
+        form so mixed-case emails still resolve to their canonical key.
+        """
+        identity = sys.intern(identity)
+        uid = self._shard_for(identity).state[_UserShard.BY_IDENTITY].get(identity)
+        if uid is None:
+            lowered = identity.lower()
+            if lowered != identity:
+                lowered = sys.intern(lowered)
+                uid = self._shard_for(lowered).state[_UserShard.BY_IDENTITY].get(lowered)
+        return self.get_by_id(uid) if uid else None
+
+
+def _trigrams(text: str) -> Set[str]:
+    """All 3-grams of *text*, skipping any that cross a field separator."""
+    return {
+        text[i : i + 3]
+        for i in range(len(text) - 2)
+        if "\x00" not in text[i : i + 3]
+    }
+
+
+def _derive_search_fields(rec: RecipeRow) -> None:
+    """Precompute lowercased fields used by filtering and search.
+
+    Doing this once per write keeps the read path free of per-recipe
+    .lower() calls and set rebuilds.
+    """
+    rec.tags_lower = frozenset(t.lower() for t in rec.tags)
+    rec.cuisine_lower = (rec.cuisine or "").lower()
+    # NUL separators prevent substring matches from spanning fields.
+    rec.search_blob_lower = "\x00".join(
+        [rec.title, rec.description, *rec.ingredients]
+    ).lower()
+
+
+class MemoryRecipeRepository:
+    """Thread-safe in-memory recipe store with per-user ratings."""
+
+    _RATING_STRIPES = 16  # power of two so the stripe pick is a mask
+
+    def __init__(self) -> None:
+        # Plain Lock: no method re-enters, and Lock skips RLock's
+        # owner/recursion bookkeeping on these tiny critical sections.
+        self._lock = threading.Lock()
+        self._by_id: Dict[str, RecipeRow] = {}
+        # Bound method cached once; _by_id is never rebound, so the hot
+        # lookup paths skip the attribute-then-method dispatch per call.
+        self._by_id_get = self._by_id.get
+        # Ratings are striped by recipe-id hash with their own locks so
+        # rating writes on unrelated recipes don't serialize on the
+        # structural lock above.
+        self._rating_stripes: List[Tuple[threading.Lock, Dict[str, Dict[str, int]]]] = [
+            (threading.Lock(), {}) for _ in range(self._RATING_STRIPES)
+        ]
+        # Running aggregates per recipe, updated by delta on each upsert
+        # so a rating write stays O(1) regardless of rater count. Only
+        # ever touched under the recipe's stripe lock. Plain dicts:
+        # defaultdict's __missing__ hook costs more per write than an
+        # explicit miss check, and auto-vivification on reads is a
+        # footgun besides.
+        self._rating_sums: Dict[str, int] = {}
+        self._rating_counts: Dict[str, int] = {}
+        # Inverted indexes kept in lockstep with _by_id so filtered reads
+        # touch only matching recipes instead of scanning the whole store.
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._cuisine_index: Dict[str, Set[str]] = {}
+        self._by_time: List[Tuple[int, str]] = []
+        self._trigram_index: Dict[str, Set[str]] = {}
+
+    def _rating_stripe(
+        self, recipe_id: str
+    ) -> Tuple[threading.Lock, Dict[str, Dict[str, int]]]:
+        return self._rating_stripes[hash(recipe_id) & (self._RATING_STRIPES - 1)]
+
+    def _index_recipe(self, rec: RecipeRow) -> None:
+        uid = rec.id
+        for tag in rec.tags_lower:
+            self._tag_index.setdefault(tag, set()).add(uid)
+        if rec.cuisine_lower:
+            self._cuisine_index.setdefault(rec.cuisine_lower, set()).add(uid)
+        bisect.insort(self._by_time, (rec.time_minutes, uid))
+        for gram in _trigrams(rec.search_blob_lower):
+            self._trigram_index.setdefault(gram, set()).add(uid)
+
+    def _unindex_recipe(self, rec: RecipeRow) -> None:
+        uid = rec.id
+        for tag in rec.tags_lower:
+            ids = self._tag_index.get(tag)
+            if ids is not None:
+                ids.discard(uid)
+                if not ids:
+                    del self._tag_index[tag]
+        ids = self._cuisine_index.get(rec.cuisine_lower)
+        if ids is not None:
+            ids.discard(uid)
+            if not ids:
+                del self._cuisine_index[rec.cuisine_lower]
+        entry = (rec.time_minutes, uid)
+        i = bisect.bisect_left(self._by_time, entry)
+        if i < len(self._by_time) and self._by_time[i] == entry:
+            self._by_time.pop(i)
+        for gram in _trigrams(rec.search_blob_lower):
+            ids = self._trigram_index.get(gram)
+            if ids is not None:
+                ids.discard(uid)
+                if not ids:
+                    del self._trigram_index[gram]
+
+    def create(self, data: dict) -> RecipeRow:
+        with self._lock:
+            # Same 128 bits of entropy as uuid4 without building and
+            # formatting a UUID object per insert.
+            uid = os.urandom(16).hex()
+            # Integer nanoseconds; converted to datetime at the schema
+            # boundary. Avoids a datetime allocation per write.
+            now = time.time_ns()
+            rec = RecipeRow(
+                id=uid,
+                rating_avg=0.0,
+                rating_count=0,
+                created_at=now,
+                updated_at=now,
+                **data,
+            )
+            _derive_search_fields(rec)
+            self._by_id[uid] = rec
+            self._index_recipe(rec)
+            return rec
+
+    def get(self, recipe_id: str) -> Optional[RecipeRow]:
+        with self._lock:
+            return self._by_id_get(recipe_id)
+
+    def update(self, recipe_id: str, updates: dict) -> Optional[RecipeRow]:
+        with self._lock:
+            rec = self._by_id.get(recipe_id)
+            if rec is None:
+                return None
+            self._unindex_recipe(rec)
+            for key, value in updates.items():
+                if value is not None:
+                    setattr(rec, key, value)
+            _derive_search_fields(rec)
+            self._index_recipe(rec)
+            rec.updated_at = time.time_ns()
+            rec._public = None
+            return rec
+
+    def delete(self, recipe_id: str) -> bool:
+        lock, ratings = self._rating_stripe(recipe_id)
+        with lock:
+            ratings.pop(recipe_id, None)
+            self._rating_sums.pop(recipe_id, None)
+            self._rating_counts.pop(recipe_id, None)
+        with self._lock:
+            rec = self._by_id.pop(recipe_id, None)
+            if rec is None:
+                return False
+            self._unindex_recipe(rec)
+            return True
+
+    def list_all(self) -> List[RecipeRow]:
+        # Lock-free snapshot: list(dict.values()) runs as a single C-level
+        # copy under the GIL, so holding _lock for the whole O(N) copy
+        # only serialized readers against writers for no extra safety.
+        return list(self._by_id.values())
+
+    def find_ids(
+        self,
+        tags: Optional[List[str]] = None,
+        cuisine: Optional[str] = None,
+        time_max: Optional[int] = None,
+    ) -> Optional[Set[str]]:
+        """Intersect index postings for the given filters.
+
+        Returns the matching recipe ids, or None when no filter was
+        given (callers should fall back to a full listing).
+        """
+        with self._lock:
+            candidate: Optional[Set[str]] = None
+            if tags:
+                for tag in tags:
+                    ids = self._tag_index.get(tag.lower(), _EMPTY)
+                    candidate = set(ids) if candidate is None else candidate & ids
+                    if not candidate:
+                        return candidate
+            if cuisine:
+                ids = self._cuisine_index.get(cuisine.lower(), _EMPTY)
+                candidate = set(ids) if candidate is None else candidate & ids
+                if not candidate:
+                    return candidate
+            if time_max is not None:
+                cut = bisect.bisect_left(self._by_time, (time_max + 1,))
+                ids = {uid for _, uid in self._by_time[:cut]}
+                candidate = ids if candidate is None else candidate & ids
+            return candidate
+
+    def ids_for_text(self, ql: str) -> Optional[Set[str]]:
+        """Candidate ids whose search blob may contain *ql*.
+
+        Intersects trigram postings; a hit is necessary but not
+        sufficient, so callers must confirm with a substring test.
+        Returns None when the query is too short for the index.
+        """
+        if len(ql) < 3:
+            return None
+        with self._lock:
+            candidate: Optional[Set[str]] = None
+            for i in range(len(ql) - 2):
+                ids = self._trigram_index.get(ql[i : i + 3], _EMPTY)
+                candidate = set(ids) if candidate is None else candidate & ids
+                if not candidate:
+                    break
+        return candidate
+
+    def page_rows(
+        self, ids: Optional[Set[str]], start: int, end: int
+    ) -> Tuple[List[RecipeRow], int]:
+        """Rows [start:end] in creation order plus the total match count.
+
+        *ids* of None means "all rows". _by_id is insertion-ordered, so
+        iterating it yields creation order; only the requested page is
+        ever materialized.
+        """
+        with self._lock:
+            if ids is None:
+                total = len(self._by_id)
+                rows = list(itertools.islice(self._by_id.values(), start, end))
+            else:
+                total = len(ids)
+                matching = (r for r in self._by_id.values() if r.id in ids)
+                rows = list(itertools.islice(matching, start, end))
+        return rows, total
+
+    def get_many(self, ids: Set[str]) -> List[RecipeRow]:
+        """Materialize rows for a candidate id set in creation order."""
+        with self._lock:
+            rows = [self._by_id[i] for i in ids if i in self._by_id]
+        rows.sort(key=lambda r: (r.created_at, r.id))
+        return rows
+
+    def upsert_rating(self, recipe_id: str, user_id: str, rating: int) -> Optional[RecipeRow]:
+        with self._lock:
+            rec = self._by_id_get(recipe_id)
+        if rec is None:
+            return None
+        lock, ratings = self._rating_stripe(recipe_id)
+        with lock:
+            inner = ratings.get(recipe_id)
+            if inner is None:
+                inner = ratings[recipe_id] = {}
+            old = inner.get(user_id)
+            inner[user_id] = rating
+            if old is None:
+                count = self._rating_counts.get(recipe_id, 0) + 1
+                self._rating_counts[recipe_id] = count
+                self._rating_sums[recipe_id] = self._rating_sums.get(recipe_id, 0) + rating
+            else:
+                count = self._rating_counts[recipe_id]
+                self._rating_sums[recipe_id] += rating - old
+            rec.rating_count = count
+            rec.rating_avg = round(self._rating_sums[recipe_id] / count, 2)
+            rec.updated_at = time.time_ns()
+            rec._public = None
+        return rec
+
+
+memory_user_repo = MemoryUserRepository()
+memory_recipe_repo = MemoryRecipeRepository()